@@ -2,7 +2,6 @@ import nibabel as nib
 import numpy as np
 from numpy.typing import NDArray
 import pandas as pd
-from tqdm import tqdm
 
 class AdultBrain:
     """
@@ -98,7 +97,7 @@ class AdultBrain:
         set
             Unique region IDs in the dataset.
         """
-        return set(self.stack.flatten().tolist())
+        return set(np.unique(self.stack).tolist())
 
     @property
     def voxel_conversion(self) -> tuple[float, float, float]:
@@ -150,6 +149,38 @@ class AdultBrain:
         stack: NDArray[np.float64] = nib.load(filepath).get_fdata()
         return cls(stack)
 
+    def _label_histogram(self) -> tuple[NDArray, NDArray]:
+        """
+        Count voxels per label, accumulating np.bincount one slice at a time so
+        no full-volume integer copy is made.
+
+        Returns
+        -------
+        tuple[NDArray, NDArray]
+            Sorted unique labels and their voxel counts.
+
+        Notes
+        -----
+        np.bincount only takes non-negative integers, so empty stacks, stacks
+        with negative labels and stacks with fractional labels are counted with
+        np.unique instead.
+        """
+        if self.stack.size == 0 or self.stack.min() < 0:
+            return np.unique(self.stack, return_counts=True)
+
+        max_label = int(self.stack.max())
+        counts = np.zeros(max_label + 1, dtype=np.int64)
+        for slice_2d in self.stack:
+            ids = slice_2d.ravel()
+            if not np.issubdtype(ids.dtype, np.integer):
+                as_int = ids.astype(np.int64)
+                if np.any(as_int != ids):
+                    return np.unique(self.stack, return_counts=True)
+                ids = as_int
+            counts += np.bincount(ids, minlength=max_label + 1)
+        labels = np.nonzero(counts)[0]
+        return labels, counts[labels]
+
     def compute_volumes(self):
         """
         Compute per-region voxel counts or volumes.
@@ -171,24 +202,14 @@ class AdultBrain:
         if self.voxel_conversion is None:
             print("No Voxel Conversion given. Performing voxel measures in voxels (counts).")
 
-        region_labels: set = self.region_labels
-        dimensions: tuple[int, ...] = self.dimensions
-
-        index: list = [f"Region {int(i)}" for i in region_labels]
-        SO: pd.Series = pd.Series(np.zeros(len(index)), index=index, name="Voxel Measures")
+        labels, counts = self._label_histogram()
 
-        stack_container: NDArray[np.float64] = np.zeros(dimensions[0])
-        for region in tqdm(region_labels, desc="Regions", unit="region", leave=False):
-            for slice_num, slice_2d in enumerate(self.stack):
-                stack_container[slice_num] = np.sum(slice_2d.flatten() == region)
-            voxel_count = stack_container.sum()
+        # If conversion is given, multiply by voxel volume
+        if self.voxel_conversion is not None:
+            voxel_volume = np.prod(self.voxel_conversion)  # sx * sy * sz
+            counts = counts * voxel_volume
 
-            # If conversion is given, multiply by voxel volume
-            if self.voxel_conversion is not None:
-                voxel_volume = np.prod(self.voxel_conversion)  # sx * sy * sz
-                SO[f"Region {np.int16(region)}"] = voxel_count * voxel_volume
-            else:
-                SO[f"Region {np.int16(region)}"] = voxel_count
+        SO: pd.Series = pd.Series(counts, index=[f"Region {int(i)}" for i in labels], name="Voxel Measures")
 
         self._volumes = SO
         return SO
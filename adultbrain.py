@@ -14,6 +14,264 @@ from numpy.typing import NDArray
 import pandas as pd
 from typing import Dict, Tuple, Optional, Iterable
 
+try:
+    from numba import njit, prange, get_num_threads
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to per-slice np.bincount
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+    # Explicit signature compiles at import; cache=True reuses the machine code across runs
+    @njit("int64[:](uint16[:, :, ::1], int64, int64)", parallel=True, cache=True, boundscheck=False)
+    def _count_labels(stack, nlabels, nthreads):
+        """
+        Per-label voxel counts of a 3D non-negative integer stack. z is split
+        into one contiguous chunk per thread and each thread fills its own
+        histogram row, so threads never share a bin; rows are summed at the end.
+        """
+        nz = stack.shape[0]
+        chunk = (nz + nthreads - 1) // nthreads
+        hist = np.zeros((nthreads, nlabels), dtype=np.int64)
+        for t in prange(nthreads):
+            for z in range(t * chunk, min(nz, (t + 1) * chunk)):
+                for y in range(stack.shape[1]):
+                    for x in range(stack.shape[2]):
+                        hist[t, stack[z, y, x]] += 1
+        return hist.sum(axis=0)
+
+
+def _as_label_array(arr: NDArray) -> NDArray[np.integer]:
+    """
+    Cast a label volume to uint16 when every label fits in it (AZBA ids top out
+    at 904). Otherwise keep an integer dtype wide enough that no label wraps.
+    The result is C-ordered; nibabel hands back Fortran-ordered arrays, and the
+    cast and reorder happen in the same pass.
+    """
+    if arr.size == 0 or (arr.min() >= 0 and arr.max() <= np.iinfo(np.uint16).max):
+        return arr.astype(np.uint16, order="C", copy=False)
+    if np.issubdtype(arr.dtype, np.integer):
+        return np.ascontiguousarray(arr)
+    return arr.astype(np.int64, order="C")
+
+# Default AZBA region names, stored as parallel arrays: _DEFAULT_NAMES[i] is the
+# name of region id i for the contiguous ids 0-198; the 900-series ids are sparse.
+_DEFAULT_NAMES: Tuple[str, ...] = (
+    "Clear Label",
+    "A (anterior thalamic nucleus)",
+    "AC (anterior cerebellar tract)",
+    "ALLN (anterior lateral line nerves)",
+    "AON (anterior octaval nucleus)",
+    "APN (accessory pretectal nucleus)",
+    "ATN (anterior tuberal nucleus)",
+    "BSTa (bed nucleus of the stria terminalis, anterior division)",
+    "BSTm (bed nucleus of the stria terminalis, medial division)",
+    "BSTpd (bed nucleus of the stria terminalis, posterior division)",
+    "C (central canal)",
+    "Cans (ansulate commissure)",
+    "Cantd (anterior commissure, dorsal part)",
+    "Cantv (anterior commissure, ventral part)",
+    "CC (cerebellar crest)",
+    "CCe-g (cerebellar corpus, granular layer)",
+    "CCe-m (cerebellar corpus, molecular layer)",
+    "Ccer (cerebellar commissure)",
+    "Cgus (commissure of the secondary gustatory nuclei)",
+    "Chab (habenular commissure)",
+    "Chor (horizontal commissure)",
+    "CIL (central nucleus of the inferior lobe)",
+    "Cinf (commissura infima of Haller)",
+    "CM (mammillary body)",
+    "CO/OT (optic chiasm / optic tract)",
+    "CON (caudal octavolateralis nucleus)",
+    "CP (central posterior thalamic nucleus)",
+    "CPN (central pretectal nucleus)",
+    "CPop (supraoptic commissure)",
+    "Cpost (posterior commissure)",
+    "Ctec (tectal commissure)",
+    "Ctub (commissure of the posterior tuberculum)",
+    "Cven (ventral rhombencephalic commisure)",
+    "DAO (dorsal accessory optic nucleus)",
+    "Dc (central zone of dorsal telencephalon area)",
+    "DH (dorsal horn)",
+    "DIL (diffuse nucleus of the inferior lobe)",
+    "DiV (diencephalic ventricle)",
+    "DIV (trochlear decussation)",
+    "Dl (lateral zone of the dorsal telencephalon)",
+    "Dm (medial zone of dorsal telencephalon)",
+    "DON (descending octaval nucleus)",
+    "DOT (dorsomedial optic tract)",
+    "Dp (posterior zone of dorsal telencephalon area)",
+    "DP (dorsal posterior thalamic nucleus)",
+    "DR (dorsal root)",
+    "DTN (dorsal tegmental nucleus)",
+    "DV (descending trigeminal root)",
+    "E (epiphysis)",
+    "ECL (external cellular layer of olfactory bulb)",
+    "EG (granular eminence)",
+    "EmTl (lateral thalamic eminence)",
+    "EmTm (medial thalamic eminence)",
+    "EmTr (rostral thalamic eminence)",
+    "ENd (entopeduncular nucleus, dorsal part)",
+    "ENv (entopeduncular nucleus, ventral part)",
+    "EW (Edinger-Westphal nucleus)",
+    "Flv (ventral part of lateral funiculus)",
+    "FR (habenulo-interpeduncular tract)",
+    "Fv (ventral funiculus)",
+    "GC (central gray)",
+    "GL (glomerular layer of olfactory bulb)",
+    "Had (dorsal habenular nucleus)",
+    "Hav (ventral habenular nucleus)",
+    "Hc (caudal zone of periventricular hypothalamus)",
+    "Hd (dorsal zone of periventricular hypothalamus)",
+    "Hv (ventral zone of periventricular hypothalamus)",
+    "I (Intermediate thalamic nucleus)",
+    "IAF (inner arcuate fibers)",
+    "ICL (internal cellular layer of olfactory bulb)",
+    "IMRF (intermediate reticular formation)",
+    "IN (Intermediate nucleus)",
+    "IO (inferior olive)",
+    "IR (inferior raphe)",
+    "IRF (inferior reticular formation)",
+    "LC (locus coeruleus)",
+    "LCa (caudal lobe of cerebellum)",
+    "LFB (lateral forebrain bundle)",
+    "LH (lateral hypothalamic nucleus)",
+    "LLF (lateral longitudinal fascicle)",
+    "LOT (lateral olfactory tract)",
+    "LR (lateral recess of diencephalic ventricle)",
+    "LRN (lateral reticular nucleus)",
+    "MAC (Mauthner cell)",
+    "MaON (magnocellular octaval nucleus)",
+    "MFB (medial forebrain bundle)",
+    "MFN (medial funicular nucleus)",
+    "MLF (medial longitudinal fascicle)",
+    "MON (medial octavolateralis nucleus)",
+    "MOT (medial olfactory tract)",
+    "NC (commissural nucleus of Cajal)",
+    "NDV (nucleus of the descending trigeminal root)",
+    "NI (isthmic nucleus)",
+    "NIn (interpeduncular nucleus)",
+    "NLL (nucleus of the lateral lemniscus)",
+    "nLOT-a (nucleus of the lateral olfactory tract, anterior part)",
+    "nLOT-i (nucleus of the lateral olfactory tract, intermediate part)",
+    "nLOT-p (nucleus of the lateral olfactory tract, posterior part)",
+    "NLV (nucleus lateralis valvulae)",
+    "NMLF (nucleus of the medial longitudinal fascicle)",
+    "NR (red nucleus)",
+    "OENc (octavolateralis efferent neurons, caudal part)",
+    "OENr (octavolateralis efferent neurons, rostral part)",
+    "P (posterior thalamic nucleus)",
+    "PC (posterior cerebellar tract)",
+    "PCN (paracommissural nucleus)",
+    "PGa (anterior preglomerular nucleus)",
+    "PGc (caudal preglomerular nucleus)",
+    "PGl (lateral preglomerular nucleus)",
+    "PGm (medial preglomerular nucleus)",
+    "PGZ (periventricular gray zone of optic tectum)",
+    "PL (perilemniscal nucleus)",
+    "PLLN (posterior lateral line nerve)",
+    "PM (magnocellular preoptic nucleus)",
+    "PMg (gigantocellular part of magnocellular preoptic nucleus)",
+    "PO (posterior pretectal nucleus)",
+    "POF (primary olfactory fiber layer)",
+    "PON (posterior octaval nucleus)",
+    "PPa (parvocellular preoptic nucleus, anterior part)",
+    "PPd (periventricular pretectal nucleus, dorsal part)",
+    "PPp (parvocellular preoptic nucleus, posterior part)",
+    "PPv (periventricular pretectal nucleus, ventral part)",
+    "PR (posterior recess of diencephalic ventricle)",
+    "PSm (magnocellular superficial pretectal nucleus)",
+    "PSp (parvocellular superficial pretectal nucleus)",
+    "PTN (posterior tuberal nucleus)",
+    "PVO (paraventricular organ)",
+    "R (rostrolateral nucleus)",
+    "RT (rostral tegmental nucleus)",
+    "RV (rhombencephalic ventricle)",
+    "SC (suprachiasmatic nucleus)",
+    "SCO (subcommissural organ)",
+    "SD (dorsal sac)",
+    "SG (subglomerular nucleus)",
+    "SGN (secondary gustatory nucleus)",
+    "SGT (secondary gustatory tract)",
+    "SO (secondary octaval population)",
+    "SR (superior raphe)",
+    "SRF (superior reticular formation)",
+    "SRN (superior reticular nucleus)",
+    "T (tangential nucleus)",
+    "TBS (bulbo-spinal tract)",
+    "TelV (telencephalic ventricles)",
+    "TeO (optic tectum)",
+    "TeV (tectal ventricle)",
+    "TGN (tertiary gustatory nucleus)",
+    "TL (longitudinal torus)",
+    "TLa (lateral torus)",
+    "TMCa (anterior mesencephalo-cerebellar tract)",
+    "TMCp (posterior mesencephalo-cerebellar tract)",
+    "TPM (pretecto-mammillary tract)",
+    "TPp (periventricular nucleus of posterior tuberculum)",
+    "TSc (central nucleus of semicircular torus)",
+    "TSvl (ventrolateral nucleus of semicircular torus)",
+    "TTB (tecto-bulbar tract)",
+    "TTBc (crossed tecto-bulbar tract)",
+    "TTBr (uncrossed tecto-bulbar tract)",
+    "TVS (vestibulo-spinal tract)",
+    "Val-g (lateral division of valvula cerebelli, granular layer)",
+    "Val-m (lateral division of valvula cerebelli, molecular layer)",
+    "Vam-g (medial division of valvula cerebelli, granular layer)",
+    "Vam-m (medial division of valvula cerebelli, molecular layer)",
+    "VAO (ventral accessory optic nucleus)",
+    "Vas (vascular lacuna of area postrema)",
+    "Vc (central nucleus of ventral telencephalon area)",
+    "Vd-dd (dorsal zone of ventral telencephalon)",
+    "Vd-vd (ventral zone of ventral telencephalon)",
+    "Vdd (dorsal most zone of ventral telencephalon)",
+    "Vl (lateral nucleus of ventral telencephalon area)",
+    "VL (ventrolateral thalamic nucleus)",
+    "VM (ventromedial thalamic nucleus)",
+    "VOT (ventrolateral optic tract)",
+    "Vp (postcommissural nucleus of ventral telencephalon area)",
+    "Vs (supracommissural nucleus of ventral telencephalon area)",
+    "Vv (ventral nucleus of ventral telencephalon area)",
+    "ZL (zona limitans)",
+    "III (oculomotor nerve)",
+    "IIIm (oculomotor nucleus)",
+    "IV (trochlear nerve)",
+    "IVm (trochlear nucleus)",
+    "V (trigeminal nerve)",
+    "Vmd (trigeminal motor nucleus, dorsal part)",
+    "Vmn (mesencephalic nucleus of the trigeminal nerve)",
+    "Vmv (trigeminal motor nucleus, ventral part)",
+    "Vmvr (ventral trigeminal motor root)",
+    "Vsm (primary sensory trigeminal nucleus)",
+    "Vsr (sensory root of the trigeminal nerve)",
+    "VImc (caudal abducens nerve motor nucleus)",
+    "VImr (rostral abducens nerve motor nucleus)",
+    "VIILo (facial lobe)",
+    "VIIm (facial motor nucleus)",
+    "VIImr (facial motor root)",
+    "VIIs (sensory root of the facial nerve)",
+    "VIII (octaval nerve)",
+    "IXLo (glossopharyngeal lobe)",
+    "IXm (glossopharyngeal nerve motor nucleus)",
+    "X (vagal nerve)",
+    "XLo (vagal lobe)",
+    "Xm (vagal motor nucleus)",
+)
+_DEFAULT_SPARSE_NAMES: Dict[int, str] = {
+    900: "UnkD (unknown diencephalon)",
+    901: "UnkMS (unknown mesencephalon)",
+    902: "UnkR (unkonwn rhombencephalon)",
+    903: "UnkSC (unknown spinal cord)",
+    904: "UnkVT (unknown ventral telencephalon)",
+}
+
+def _region_name_array(lut: Dict[int, str]) -> NDArray[np.object_]:
+    """Object array with arr[region_id] = name and None for ids not in `lut`."""
+    ids = [k for k in lut if k >= 0]
+    arr = np.full(max(ids, default=-1) + 1, None, dtype=object)
+    arr[ids] = [lut[k] for k in ids]
+    return arr
+
 class AdultBrain:
     """
     Segmented adult brain volume with per-region voxel/volume statistics
@@ -21,222 +279,21 @@ class AdultBrain:
     """
 
     # Regions Names Lookup Table (LUT)
-    DEFAULT_REGION_LUT: Dict[int, str] = {
-        0:  "Clear Label",
-        1:  "A (anterior thalamic nucleus)",
-        2:  "AC (anterior cerebellar tract)",
-        3:  "ALLN (anterior lateral line nerves)",
-        4:  "AON (anterior octaval nucleus)",
-        5:  "APN (accessory pretectal nucleus)",
-        6:  "ATN (anterior tuberal nucleus)",
-        7:  "BSTa (bed nucleus of the stria terminalis, anterior division)",
-        8:  "BSTm (bed nucleus of the stria terminalis, medial division)",
-        9:  "BSTpd (bed nucleus of the stria terminalis, posterior division)",
-        10: "C (central canal)",
-        11: "Cans (ansulate commissure)",
-        12: "Cantd (anterior commissure, dorsal part)",
-        13: "Cantv (anterior commissure, ventral part)",
-        14: "CC (cerebellar crest)",
-        15: "CCe-g (cerebellar corpus, granular layer)",
-        16: "CCe-m (cerebellar corpus, molecular layer)",
-        17: "Ccer (cerebellar commissure)",
-        18: "Cgus (commissure of the secondary gustatory nuclei)",
-        19: "Chab (habenular commissure)",
-        20: "Chor (horizontal commissure)",
-        21: "CIL (central nucleus of the inferior lobe)",
-        22: "Cinf (commissura infima of Haller)",
-        23: "CM (mammillary body)",
-        24: "CO/OT (optic chiasm / optic tract)",
-        25: "CON (caudal octavolateralis nucleus)",
-        26: "CP (central posterior thalamic nucleus)",
-        27: "CPN (central pretectal nucleus)",
-        28: "CPop (supraoptic commissure)",
-        29: "Cpost (posterior commissure)",
-        30: "Ctec (tectal commissure)",
-        31: "Ctub (commissure of the posterior tuberculum)",
-        32: "Cven (ventral rhombencephalic commisure)",
-        33: "DAO (dorsal accessory optic nucleus)",
-        34: "Dc (central zone of dorsal telencephalon area)",
-        35: "DH (dorsal horn)",
-        36: "DIL (diffuse nucleus of the inferior lobe)",
-        37: "DiV (diencephalic ventricle)",
-        38: "DIV (trochlear decussation)",
-        39: "Dl (lateral zone of the dorsal telencephalon)",
-        40: "Dm (medial zone of dorsal telencephalon)",
-        41: "DON (descending octaval nucleus)",
-        42: "DOT (dorsomedial optic tract)",
-        43: "Dp (posterior zone of dorsal telencephalon area)",
-        44: "DP (dorsal posterior thalamic nucleus)",
-        45: "DR (dorsal root)",
-        46: "DTN (dorsal tegmental nucleus)",
-        47: "DV (descending trigeminal root)",
-        48: "E (epiphysis)",
-        49: "ECL (external cellular layer of olfactory bulb)",
-        50: "EG (granular eminence)",
-        51: "EmTl (lateral thalamic eminence)",
-        52: "EmTm (medial thalamic eminence)",
-        53: "EmTr (rostral thalamic eminence)",
-        54: "ENd (entopeduncular nucleus, dorsal part)",
-        55: "ENv (entopeduncular nucleus, ventral part)",
-        56: "EW (Edinger-Westphal nucleus)",
-        57: "Flv (ventral part of lateral funiculus)",
-        58: "FR (habenulo-interpeduncular tract)",
-        59: "Fv (ventral funiculus)",
-        60: "GC (central gray)",
-        61: "GL (glomerular layer of olfactory bulb)",
-        62: "Had (dorsal habenular nucleus)",
-        63: "Hav (ventral habenular nucleus)",
-        64: "Hc (caudal zone of periventricular hypothalamus)",
-        65: "Hd (dorsal zone of periventricular hypothalamus)",
-        66: "Hv (ventral zone of periventricular hypothalamus)",
-        67: "I (Intermediate thalamic nucleus)",
-        68: "IAF (inner arcuate fibers)",
-        69: "ICL (internal cellular layer of olfactory bulb)",
-        70: "IMRF (intermediate reticular formation)",
-        71: "IN (Intermediate nucleus)",
-        72: "IO (inferior olive)",
-        73: "IR (inferior raphe)",
-        74: "IRF (inferior reticular formation)",
-        75: "LC (locus coeruleus)",
-        76: "LCa (caudal lobe of cerebellum)",
-        77: "LFB (lateral forebrain bundle)",
-        78: "LH (lateral hypothalamic nucleus)",
-        79: "LLF (lateral longitudinal fascicle)",
-        80: "LOT (lateral olfactory tract)",
-        81: "LR (lateral recess of diencephalic ventricle)",
-        82: "LRN (lateral reticular nucleus)",
-        83: "MAC (Mauthner cell)",
-        84: "MaON (magnocellular octaval nucleus)",
-        85: "MFB (medial forebrain bundle)",
-        86: "MFN (medial funicular nucleus)",
-        87: "MLF (medial longitudinal fascicle)",
-        88: "MON (medial octavolateralis nucleus)",
-        89: "MOT (medial olfactory tract)",
-        90: "NC (commissural nucleus of Cajal)",
-        91: "NDV (nucleus of the descending trigeminal root)",
-        92: "NI (isthmic nucleus)",
-        93: "NIn (interpeduncular nucleus)",
-        94: "NLL (nucleus of the lateral lemniscus)",
-        95: "nLOT-a (nucleus of the lateral olfactory tract, anterior part)",
-        96: "nLOT-i (nucleus of the lateral olfactory tract, intermediate part)",
-        97: "nLOT-p (nucleus of the lateral olfactory tract, posterior part)",
-        98: "NLV (nucleus lateralis valvulae)",
-        99: "NMLF (nucleus of the medial longitudinal fascicle)",
-        100: "NR (red nucleus)",
-        101: "OENc (octavolateralis efferent neurons, caudal part)",
-        102: "OENr (octavolateralis efferent neurons, rostral part)",
-        103: "P (posterior thalamic nucleus)",
-        104: "PC (posterior cerebellar tract)",
-        105: "PCN (paracommissural nucleus)",
-        106: "PGa (anterior preglomerular nucleus)",
-        107: "PGc (caudal preglomerular nucleus)",
-        108: "PGl (lateral preglomerular nucleus)",
-        109: "PGm (medial preglomerular nucleus)",
-        110: "PGZ (periventricular gray zone of optic tectum)",
-        111: "PL (perilemniscal nucleus)",
-        112: "PLLN (posterior lateral line nerve)",
-        113: "PM (magnocellular preoptic nucleus)",
-        114: "PMg (gigantocellular part of magnocellular preoptic nucleus)",
-        115: "PO (posterior pretectal nucleus)",
-        116: "POF (primary olfactory fiber layer)",
-        117: "PON (posterior octaval nucleus)",
-        118: "PPa (parvocellular preoptic nucleus, anterior part)",
-        119: "PPd (periventricular pretectal nucleus, dorsal part)",
-        120: "PPp (parvocellular preoptic nucleus, posterior part)",
-        121: "PPv (periventricular pretectal nucleus, ventral part)",
-        122: "PR (posterior recess of diencephalic ventricle)",
-        123: "PSm (magnocellular superficial pretectal nucleus)",
-        124: "PSp (parvocellular superficial pretectal nucleus)",
-        125: "PTN (posterior tuberal nucleus)",
-        126: "PVO (paraventricular organ)",
-        127: "R (rostrolateral nucleus)",
-        128: "RT (rostral tegmental nucleus)",
-        129: "RV (rhombencephalic ventricle)",
-        130: "SC (suprachiasmatic nucleus)",
-        131: "SCO (subcommissural organ)",
-        132: "SD (dorsal sac)",
-        133: "SG (subglomerular nucleus)",
-        134: "SGN (secondary gustatory nucleus)",
-        135: "SGT (secondary gustatory tract)",
-        136: "SO (secondary octaval population)",
-        137: "SR (superior raphe)",
-        138: "SRF (superior reticular formation)",
-        139: "SRN (superior reticular nucleus)",
-        140: "T (tangential nucleus)",
-        141: "TBS (bulbo-spinal tract)",
-        142: "TelV (telencephalic ventricles)",
-        143: "TeO (optic tectum)",
-        144: "TeV (tectal ventricle)",
-        145: "TGN (tertiary gustatory nucleus)",
-        146: "TL (longitudinal torus)",
-        147: "TLa (lateral torus)",
-        148: "TMCa (anterior mesencephalo-cerebellar tract)",
-        149: "TMCp (posterior mesencephalo-cerebellar tract)",
-        150: "TPM (pretecto-mammillary tract)",
-        151: "TPp (periventricular nucleus of posterior tuberculum)",
-        152: "TSc (central nucleus of semicircular torus)",
-        153: "TSvl (ventrolateral nucleus of semicircular torus)",
-        154: "TTB (tecto-bulbar tract)",
-        155: "TTBc (crossed tecto-bulbar tract)",
-        156: "TTBr (uncrossed tecto-bulbar tract)",
-        157: "TVS (vestibulo-spinal tract)",
-        158: "Val-g (lateral division of valvula cerebelli, granular layer)",
-        159: "Val-m (lateral division of valvula cerebelli, molecular layer)",
-        160: "Vam-g (medial division of valvula cerebelli, granular layer)",
-        161: "Vam-m (medial division of valvula cerebelli, molecular layer)",
-        162: "VAO (ventral accessory optic nucleus)",
-        163: "Vas (vascular lacuna of area postrema)",
-        164: "Vc (central nucleus of ventral telencephalon area)",
-        165: "Vd-dd (dorsal zone of ventral telencephalon)",
-        166: "Vd-vd (ventral zone of ventral telencephalon)",
-        167: "Vdd (dorsal most zone of ventral telencephalon)",
-        168: "Vl (lateral nucleus of ventral telencephalon area)",
-        169: "VL (ventrolateral thalamic nucleus)",
-        170: "VM (ventromedial thalamic nucleus)",
-        171: "VOT (ventrolateral optic tract)",
-        172: "Vp (postcommissural nucleus of ventral telencephalon area)",
-        173: "Vs (supracommissural nucleus of ventral telencephalon area)",
-        174: "Vv (ventral nucleus of ventral telencephalon area)",
-        175: "ZL (zona limitans)",
-        176: "III (oculomotor nerve)",
-        177: "IIIm (oculomotor nucleus)",
-        178: "IV (trochlear nerve)",
-        179: "IVm (trochlear nucleus)",
-        180: "V (trigeminal nerve)",
-        181: "Vmd (trigeminal motor nucleus, dorsal part)",
-        182: "Vmn (mesencephalic nucleus of the trigeminal nerve)",
-        183: "Vmv (trigeminal motor nucleus, ventral part)",
-        184: "Vmvr (ventral trigeminal motor root)",
-        185: "Vsm (primary sensory trigeminal nucleus)",
-        186: "Vsr (sensory root of the trigeminal nerve)",
-        187: "VImc (caudal abducens nerve motor nucleus)",
-        188: "VImr (rostral abducens nerve motor nucleus)",
-        189: "VIILo (facial lobe)",
-        190: "VIIm (facial motor nucleus)",
-        191: "VIImr (facial motor root)",
-        192: "VIIs (sensory root of the facial nerve)",
-        193: "VIII (octaval nerve)",
-        194: "IXLo (glossopharyngeal lobe)",
-        195: "IXm (glossopharyngeal nerve motor nucleus)",
-        196: "X (vagal nerve)",
-        197: "XLo (vagal lobe)",
-        198: "Xm (vagal motor nucleus)",
-        900: "UnkD (unknown diencephalon)",
-        901: "UnkMS (unknown mesencephalon)",
-        902: "UnkR (unkonwn rhombencephalon)",
-        903: "UnkSC (unknown spinal cord)",
-        904: "UnkVT (unknown ventral telencephalon)",
-    }
-
-    def __init__(self, stack: NDArray[np.float64], region_lookup: Optional[Dict[int, str]] = None):
-        if stack.ndim != 3:
-            raise ValueError(f"Expected a 3D array, got shape {stack.shape}")
-        self.stack: NDArray[np.float64] = stack
+    DEFAULT_REGION_LUT: Dict[int, str] = {**dict(enumerate(_DEFAULT_NAMES)), **_DEFAULT_SPARSE_NAMES}
+
+    def __init__(self, stack: NDArray[np.integer], region_lookup: Optional[Dict[int, str]] = None):
         self._volumes_df: Optional[pd.DataFrame] = None
         self._volumes_series: Optional[pd.Series] = None
+        # (labels, measures, measure_col) from the last compute_volumes; Series built on demand
+        self._volumes_parts: Optional[Tuple[np.ndarray, np.ndarray, str]] = None
         self._voxel_conversion: Optional[Tuple[float, float, float]] = None
-        # Start with default LUT; allow override via constructor
-        self._region_lookup: Dict[int, str] = dict(self.DEFAULT_REGION_LUT)
+        # (labels, counts) over the whole stack; only depends on self.stack
+        self._hist_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.stack = stack
+        # Start with default LUT (shared, copied on first write); allow override via constructor
+        self._region_lookup: Dict[int, str] = self.DEFAULT_REGION_LUT
+        # Id-indexed view of the LUT so names resolve with one fancy index; rebuilt lazily
+        self._region_name_arr: Optional[NDArray[np.object_]] = None
         if region_lookup:
             self.set_region_lookup(region_lookup)
 
@@ -252,12 +309,42 @@ class AdultBrain:
         return "\n".join(lines)
 
     # Properties - Needed to set/change class params
+    @property
+    def stack(self) -> NDArray[np.integer]:
+        return self._stack
+
+    @stack.setter
+    def stack(self, stack: NDArray[np.integer]) -> None:
+        """
+        Replace the segmentation volume and drop everything computed from it.
+        In-place edits to the array (e.g. obj.stack[...] = 0) are not detected;
+        reassign obj.stack to have volumes and region_labels recomputed.
+        """
+        if stack.ndim != 3:
+            raise ValueError(f"Expected a 3D array, got shape {stack.shape}")
+        # Cast float input to integer labels once here rather than per call.
+        # Slice loops and ravel() below assume C order.
+        if not np.issubdtype(stack.dtype, np.integer):
+            stack = _as_label_array(stack)
+        else:
+            stack = np.ascontiguousarray(stack)
+        self._stack: NDArray[np.integer] = stack
+        self._hist_cache = None
+        self._volumes_df = None
+        self._volumes_parts = None
+        self._volumes_series = None
+
     @property
     def volumes(self) -> Optional[pd.DataFrame]:
         return self._volumes_df
 
     @property
     def volumes_series(self) -> Optional[pd.Series]:
+        if self._volumes_series is None and self._volumes_parts is not None:
+            labels, measures, measure_col = self._volumes_parts
+            self._volumes_series = pd.Series(
+                measures, index=np.char.add("Region ", labels.astype(str)), name=measure_col
+            )
         return self._volumes_series
 
     @property
@@ -266,7 +353,9 @@ class AdultBrain:
 
     @property
     def region_labels(self) -> Iterable[int]:
-        return np.unique(self.stack.astype(np.int64, copy=False)).tolist()
+        if self._hist_cache is None:
+            self._hist_cache = self._label_histogram()
+        return self._hist_cache[0].tolist()
 
     @property
     def voxel_conversion(self) -> Optional[Tuple[float, float, float]]:
@@ -288,41 +377,91 @@ class AdultBrain:
         """
         cleaned = {int(k): str(v) for k, v in lut.items()}
         if merge:
+            if self._region_lookup is self.DEFAULT_REGION_LUT:
+                self._region_lookup = dict(self.DEFAULT_REGION_LUT)
             self._region_lookup.update(cleaned)
         else:
             self._region_lookup = cleaned
+        self._region_name_arr = None
 
     def load_region_lookup_from_itksnap(self, filepath: str, keep_zero: bool = True, merge: bool = True) -> None:
         """
         Load LUT from an ITK-SNAP label file and merge/replace.
         """
-        lut: Dict[int, str] = {}
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                s = line.strip()
-                if not s or s.startswith("#"):
-                    continue
-                if '"' in s:
-                    parts = s.split('"')
-                    left = parts[0].strip()
-                    label = parts[1].strip()
-                    try:
-                        idx = int(left.split()[0])
-                    except Exception:
-                        continue
-                    if idx == 0 and not keep_zero:
-                        continue
-                    lut[idx] = label
+        # Columns are IDX R G B A VIS MSH "LABEL"; let the C parser split them
+        try:
+            df = pd.read_csv(
+                filepath, sep=r"\s+", comment="#", header=None, quotechar='"',
+                usecols=[0, 7], names=["idx", "label"], dtype={"label": str},
+                keep_default_na=False, on_bad_lines="skip", encoding="utf-8",
+            )
+        except pd.errors.EmptyDataError:
+            df = pd.DataFrame({"idx": [], "label": []})
+        idx = pd.to_numeric(df["idx"], errors="coerce")
+        keep = idx.notna() & (df["label"] != "")
+        if not keep_zero:
+            keep &= idx != 0
+        lut: Dict[int, str] = dict(zip(idx[keep].astype(int), df["label"][keep].str.strip()))
         self.set_region_lookup(lut, merge=merge)
         print(f"Loaded {len(lut)} labels from: {filepath} (merge={merge})")
 
     # class method - constuctur
     @classmethod
     def from_file(cls, filepath: str, region_lookup: Optional[Dict[int, str]] = None) -> "AdultBrain":
-        stack: NDArray[np.float64] = nib.load(filepath).get_fdata()
+        # dataobj skips the float64 copy get_fdata() would materialize
+        stack: NDArray[np.integer] = _as_label_array(np.asarray(nib.load(filepath).dataobj))
         return cls(stack, region_lookup=region_lookup)
 
+    @classmethod
+    def from_file_streaming(cls, filepath: str, region_lookup: Optional[Dict[int, str]] = None) -> "AdultBrain":
+        """
+        Like from_file, but decodes the image one slice (last axis) at a time
+        straight into a uint16 stack and builds the label histogram in the
+        same pass, so compute_volumes() does not rescan the volume.
+        Falls back to from_file if any label does not fit in uint16.
+        """
+        # keep_file_open: otherwise each proxy slice reopens a .nii.gz and re-decompresses from byte 0
+        proxy = nib.load(filepath, keep_file_open=True).dataobj
+        if len(proxy.shape) != 3:
+            raise ValueError(f"Expected a 3D array, got shape {proxy.shape}")
+        # Fortran order makes each last-axis slice one contiguous block, like the file itself
+        stack: NDArray[np.integer] = np.empty(proxy.shape, dtype=np.uint16, order="F")
+        counts_full = np.zeros(1, dtype=np.int64)
+        for z in range(proxy.shape[-1]):
+            sl = np.asarray(proxy[..., z])
+            if sl.size and (sl.min() < 0 or sl.max() > np.iinfo(np.uint16).max):
+                return cls.from_file(filepath, region_lookup=region_lookup)
+            sl = sl.astype(np.uint16, copy=False)
+            stack[..., z] = sl
+            c = np.bincount(sl.ravel())
+            if c.size > counts_full.size:
+                c[:counts_full.size] += counts_full
+                counts_full = c
+            else:
+                counts_full[:c.size] += c
+        brain = cls(stack, region_lookup=region_lookup)
+        labels = np.nonzero(counts_full)[0]
+        brain._hist_cache = (labels, counts_full[labels])
+        return brain
+
     # math
+    def _label_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self.stack.size and int(self.stack.min()) < 0:
+            # bincount can't take negative ids (e.g. a -1 background); sort-based count instead
+            labels, counts = np.unique(self.stack, return_counts=True)
+            return labels.astype(np.int64), counts
+        # Region ids are small non-negative ints: a counting pass beats sorting via np.unique.
+        # Accumulate per z-slice so the working set stays one slice wide.
+        max_label = int(self.stack.max()) if self.stack.size else 0
+        if _HAS_NUMBA and self.stack.dtype == np.uint16 and self.stack.flags.c_contiguous:
+            counts_full = _count_labels(self.stack, max_label + 1, get_num_threads())
+        else:
+            counts_full = np.zeros(max_label + 1, dtype=np.int64)
+            for sl in self.stack:
+                counts_full += np.bincount(sl.ravel(), minlength=max_label + 1)
+        labels = np.nonzero(counts_full)[0]
+        return labels, counts_full[labels]
+
     def compute_volumes(
         self,
         include_zero: bool = False,
@@ -330,35 +469,48 @@ class AdultBrain:
         sort_by: str = "region_id",   # 'region_id' or 'measure'
         ascending: bool = True,
     ):
-        labels, counts = np.unique(self.stack.astype(np.int64, copy=False), return_counts=True)
+        if sort_by not in {"region_id", "measure"}:
+            raise ValueError("sort_by must be 'region_id' or 'measure'")
+
+        if self._hist_cache is None:
+            self._hist_cache = self._label_histogram()
+        labels, counts = self._hist_cache
         if not include_zero:
             mask = labels != 0
             labels, counts = labels[mask], counts[mask]
 
         if self.voxel_conversion is not None:
             voxel_volume = float(np.prod(self.voxel_conversion))
-            measures = counts.astype(np.float64) * voxel_volume
+            measures = np.multiply(counts, voxel_volume, dtype=np.float64)
             measure_col = f"Volume (voxel_size={self._voxel_conversion})"
         else:
             measures = counts.astype(np.int64)
             measure_col = "Voxels"
 
+        if self._region_name_arr is None:
+            self._region_name_arr = _region_name_array(self._region_lookup)
+        names = np.full(labels.size, None, dtype=object)
+        known = (labels >= 0) & (labels < self._region_name_arr.size)
+        names[known] = self._region_name_arr[labels[known]]
+        missing = pd.isna(names)
+        names[missing] = [f"Region {int(r)}" for r in labels[missing]]
+
+        # labels come out of the histogram already sorted by region id
+        if sort_by == "region_id":
+            order = slice(None) if ascending else slice(None, None, -1)
+        else:
+            order = np.argsort(measures if ascending else -measures, kind="stable")
+
         df = pd.DataFrame({
-            "region_id": labels,
-            "region_label": [self._region_lookup.get(int(r), f"Region {int(r)}") for r in labels],
-            "measure": measures,
+            "region_id": labels[order],
+            "region_label": names[order],
+            measure_col: measures[order],
         })
 
-        if sort_by not in {"region_id", "measure"}:
-            raise ValueError("sort_by must be 'region_id' or 'measure'")
-        df = df.sort_values(sort_by, ascending=ascending, kind="mergesort").reset_index(drop=True)
-        df = df.rename(columns={"measure": measure_col})
-
         self._volumes_df = df
-        self._volumes_series = pd.Series(
-            measures, index=[f"Region {int(i)}" for i in labels], name=measure_col
-        )
-        return df if as_dataframe else self._volumes_series
+        self._volumes_parts = (labels, measures, measure_col)
+        self._volumes_series = None
+        return df if as_dataframe else self.volumes_series
 
     # write to file
     def write_regions(self, output_file_path: str) -> None: